@@ -1,4 +1,5 @@
 from .item import Item
-from .enum import Enum
+from .enum import Enum, LazyEnum
 from .utils import get_enum_or_404
-from .fields import EnumField
+from .fields import EnumField, EnumSetField
+from .preload import preload
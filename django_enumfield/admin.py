@@ -0,0 +1,119 @@
+import copy
+import hashlib
+
+from django.contrib import admin
+from django.core.cache import cache
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class EnumFieldListFilter(admin.FieldListFilter):
+    """
+    Admin list filter for ``EnumField`` that shows the number of rows for
+    each item, fetched with a single ``GROUP BY`` query.
+
+    Set ``cache_timeout`` (in seconds) on a subclass to cache the counts::
+
+        class CachedEnumFieldListFilter(EnumFieldListFilter):
+            cache_timeout = 60
+
+        class JobAdmin(admin.ModelAdmin):
+            list_filter = [('status', CachedEnumFieldListFilter)]
+    """
+
+    cache_timeout = None
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.lookup_kwarg = "%s__exact" % field_path
+        self.lookup_kwarg_isnull = "%s__isnull" % field_path
+        self.lookup_val = params.get(self.lookup_kwarg)
+        self.lookup_val_isnull = params.get(self.lookup_kwarg_isnull)
+        self.request = request
+
+        super(EnumFieldListFilter, self).__init__(
+            field, request, params, model, model_admin, field_path
+        )
+
+    def expected_parameters(self):
+        return [self.lookup_kwarg, self.lookup_kwarg_isnull]
+
+    def get_unfiltered_queryset(self, changelist):
+        """
+        Returns the changelist's queryset with every filter applied except
+        this one, so that the counts of the other items can still be shown
+        whilst one is selected.
+        """
+
+        if not self.used_parameters:
+            return changelist.queryset
+
+        changelist = copy.copy(changelist)
+        changelist.params = {
+            x: y
+            for x, y in changelist.params.items()
+            if x not in self.expected_parameters()
+        }
+
+        return changelist.get_queryset(self.request)
+
+    def get_counts(self, queryset):
+        queryset = (
+            queryset.order_by()
+            .values_list(
+                models.ExpressionWrapper(
+                    models.F(self.field_path),
+                    output_field=models.IntegerField(),
+                ),
+            )
+            .annotate(count=models.Count("*"))
+        )
+
+        key = None
+        if self.cache_timeout is not None:
+            sql, params = queryset.query.sql_with_params()
+            key = (
+                "django_enumfield.admin.%s"
+                % hashlib.sha256(
+                    ("%s:%s:%r" % (queryset.db, sql, params)).encode("utf-8")
+                ).hexdigest()
+            )
+
+            counts = cache.get(key)
+            if counts is not None:
+                return counts
+
+        counts = dict(queryset)
+
+        if key is not None:
+            cache.set(key, counts, self.cache_timeout)
+
+        return counts
+
+    def choices(self, changelist):
+        counts = self.get_counts(self.get_unfiltered_queryset(changelist))
+
+        yield {
+            "selected": self.lookup_val is None and self.lookup_val_isnull is None,
+            "query_string": changelist.get_query_string(
+                remove=[self.lookup_kwarg, self.lookup_kwarg_isnull]
+            ),
+            "display": _("All"),
+        }
+
+        for item, display in self.field.enum.get_choices():
+            yield {
+                "selected": self.lookup_val is not None and item == self.lookup_val,
+                "query_string": changelist.get_query_string(
+                    {self.lookup_kwarg: item.value}, [self.lookup_kwarg_isnull]
+                ),
+                "display": "%s (%d)" % (display, counts.get(item.value, 0)),
+            }
+
+        if self.field.null:
+            yield {
+                "selected": bool(self.lookup_val_isnull),
+                "query_string": changelist.get_query_string(
+                    {self.lookup_kwarg_isnull: "True"}, [self.lookup_kwarg]
+                ),
+                "display": "%s (%d)" % (_("None"), counts.get(None, 0)),
+            }
@@ -0,0 +1,107 @@
+import functools
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from django.utils import translation
+
+from .item import Item
+
+REPRESENTATIONS = ("value", "slug", "object")
+
+
+def item_to_json(item, representation="value", language=None):
+    """
+    Returns the JSON-serialisable representation of ``item``: its ``value``,
+    its ``slug``, or an ``object`` of its value, slug and display in
+    ``language`` (the active language by default).
+    """
+
+    if representation == "value":
+        return item.value
+
+    if representation == "slug":
+        return item.slug
+
+    check_representation(representation)
+
+    if language is None:
+        language = translation.get_language()
+
+    # Cache the "object" representation on the item itself, per language, so
+    # that it is discarded along with the item. Items compare by value, so
+    # cannot be used as keys of a shared cache.
+    try:
+        cache = item._json_objects
+    except AttributeError:
+        cache = item._json_objects = {}
+
+    try:
+        result = cache[language]
+    except KeyError:
+        with translation.override(language):
+            result = cache[language] = {
+                "value": item.value,
+                "slug": item.slug,
+                "display": str(item.display),
+            }
+
+    # Return a copy so that callers cannot modify the cached object.
+    return dict(result)
+
+
+def check_representation(representation):
+    if representation not in REPRESENTATIONS:
+        raise ValueError(
+            "Item representation should be one of %s, not %r"
+            % (", ".join(REPRESENTATIONS), representation)
+        )
+
+
+class EnumJSONEncoder(DjangoJSONEncoder):
+    """
+    JSON encoder that encodes ``Item`` instances according to
+    ``item_representation`` (see ``item_to_json``).
+    """
+
+    item_representation = "value"
+
+    def __init__(self, *args, **kwargs):
+        super(EnumJSONEncoder, self).__init__(*args, **kwargs)
+
+        # Encoders are created for each document, so only look up the active
+        # language once rather than for every item.
+        self.language = translation.get_language()
+
+    def default(self, o):
+        if isinstance(o, Item):
+            return item_to_json(o, self.item_representation, self.language)
+
+        return super(EnumJSONEncoder, self).default(o)
+
+
+@functools.lru_cache()
+def get_encoder(representation):
+    """
+    Returns an ``EnumJSONEncoder`` subclass using ``representation``.
+    """
+
+    check_representation(representation)
+
+    return type(
+        "EnumJSONEncoder",
+        (EnumJSONEncoder,),
+        {"item_representation": representation},
+    )
+
+
+class EnumJsonResponse(JsonResponse):
+    """
+    ``JsonResponse`` that encodes ``Item`` instances, eg.::
+
+        return EnumJsonResponse({'status': job.status}, representation='slug')
+    """
+
+    def __init__(self, data, representation="value", **kwargs):
+        kwargs.setdefault("encoder", get_encoder(representation))
+
+        super(EnumJsonResponse, self).__init__(data, **kwargs)
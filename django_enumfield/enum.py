@@ -1,4 +1,9 @@
+import copyreg
 import difflib
+import threading
+import collections
+
+from django.db import models
 
 from .item import Item
 
@@ -30,33 +35,243 @@ class NoSuchSlugValueError(ValueError):
         return "%s(%r)" % (type(self).__name__, self._message())
 
 
+class EnumLoadError(RuntimeError):
+    """
+    Raised when the loader of a ``LazyEnum`` fails. Deliberately not a
+    ``ValueError``, so that lookups do not mistake it for an invalid value.
+    """
+
+
+class EnumState:
+    """
+    Immutable snapshot of an enum's items and indexes. Enums replace their
+    snapshot wholesale when modified, so readers always see a consistent
+    view without locking.
+    """
+
+    __slots__ = ("items", "values", "slugs", "attrs", "choices", "positions")
+
+    def __init__(self, items):
+        self.items = tuple(items)
+        self.values = {x.value: x for x in self.items}
+        self.slugs = {x.slug.lower(): x for x in self.items}
+        self.attrs = {x.slug.upper(): x for x in self.items}
+        self.choices = tuple((x, x.display) for x in self.items)
+        self.positions = {x.value: idx for idx, x in enumerate(self.items)}
+
+
+class ItemGroup(frozenset):
+    """
+    A named, immutable set of an enum's items, as declared by ``Enum.group``.
+    Also keeps the items' values, ready to be passed to the ORM.
+    """
+
+    def __new__(cls, name, items):
+        self = super(ItemGroup, cls).__new__(cls, items)
+        self.name = name
+        self.items = tuple(items)
+        self.values = tuple(x.value for x in self.items)
+        return self
+
+    def __reduce__(self):
+        return (type(self), (self.name, self.items))
+
+    def __repr__(self):
+        return "<%s: %s>" % (self.name, list(self.items))
+
+    def q(self, field):
+        """
+        Returns a ``Q`` object matching rows whose ``field`` is in this group.
+        """
+
+        return models.Q(**{"%s__in" % field: self.values})
+
+
+# Serialises writers; readers never take this. Re-entrant as adding items to a
+# LazyEnum loads it first.
+lock = threading.RLock()
+
+
 class Enum(list):
     def __init__(self, name, *items):
         self.name = name
+        self.frozen = False
+
+        self._state = EnumState(())
+        self._groups = {}
+
+        # Allowed state transitions, mapping each source item to a frozenset of
+        # target items. None until declared with ``transitions``.
+        self._transitions = None
 
         super(Enum, self).__init__()
 
-        for x in items:
-            self.add_item(x)
+        self.add_items(items)
 
     def __repr__(self):
         return "<%s: %s>" % (self.name, list(self))
 
-    def add_item(self, item):
-        for name, fn, value in (
-            ("value", self.from_value, item.value),
-            ("slug", self.from_slug, item.slug),
-        ):
+    def __getattr__(self, name):
+        # Items are available as attributes by their upper-cased slug.
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        try:
+            return self._state.attrs[name]
+        except KeyError:
+            pass
+
+        try:
+            return self._groups[name]
+        except KeyError:
+            raise AttributeError(
+                "%r object has no attribute %r" % (type(self).__name__, name)
+            )
+
+    def __iter__(self):
+        return iter(self._state.items)
+
+    def __reversed__(self):
+        return reversed(self._state.items)
+
+    def __len__(self):
+        return len(self._state.items)
+
+    def __getitem__(self, idx):
+        return self._state.items[idx]
+
+    def __contains__(self, value):
+        # Same semantics as comparing against each item with Item.__eq__, but
+        # using the indexes rather than scanning the list.
+        state = self._state
+
+        if isinstance(value, Item):
+            return value.value in state.values
+
+        if isinstance(value, (int, str)):
             try:
-                fn(value)
+                return int(value) in state.values
             except ValueError:
-                pass
-            else:
-                raise ValueError("Duplicate item %s: %r" % (name, value))
+                item = state.slugs.get(value.lower())
+                return item is not None and item.slug == value
+
+        return False
+
+    def __reduce_ex__(self, protocol):
+        # Lists are otherwise pickled and copied by calling extend() on a new
+        # instance before its state has been restored.
+        return (copyreg.__newobj__, (type(self),), self.__dict__)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+        if self.loaded:
+            list.extend(self, self._state.items)
+
+    def append(self, item):
+        self.add_item(item)
+
+    def extend(self, items):
+        self.add_items(items)
+
+    def __iadd__(self, items):
+        self.add_items(items)
+        return self
+
+    def _not_supported(self, *args, **kwargs):
+        raise TypeError(
+            "Items can only be added to enum %s, with add_item() or add_items()"
+            % self.name
+        )
+
+    insert = __setitem__ = __delitem__ = __imul__ = _not_supported
+    sort = reverse = remove = pop = clear = _not_supported
+
+    def add_item(self, item):
+        self.add_items([item])
+
+    def add_items(self, items):
+        """
+        Adds several items at once, publishing a single new snapshot.
+        """
+
+        items = tuple(items)
+
+        with lock:
+            self._check_not_frozen()
+
+            # Publish a new snapshot in a single assignment, then keep the
+            # underlying list in sync for code using list methods directly.
+            self._state = self._extend_state(self._state, items)
+            list.extend(self, items)
+
+    def _extend_state(self, state, items):
+        values = set(state.values)
+        slugs = set(state.slugs)
+
+        for x in items:
+            if x.value in values:
+                raise ValueError("Duplicate item value: %r" % x.value)
+
+            if x.slug.lower() in slugs:
+                raise ValueError("Duplicate item slug: %r" % x.slug)
+
+            if x.slug.upper() in self._groups:
+                raise ValueError("Item slug clashes with group: %r" % x.slug)
+
+            values.add(x.value)
+            slugs.add(x.slug.lower())
+
+        return EnumState(state.items + items)
+
+    @property
+    def loaded(self):
+        return "_state" in self.__dict__
+
+    def group(self, name, *items):
+        """
+        Declares a named group of items, available as an attribute of the
+        enum, eg.::
+
+            Status.group('OPEN', Status.PENDING, Status.RUNNING)
+
+            Status.RUNNING in Status.OPEN
+            Job.objects.filter(Status.OPEN.q('status'))
+        """
 
-        setattr(self, item.slug.upper(), item)
+        group = ItemGroup(name, [self.get_item(x) for x in items])
 
-        self.append(item)
+        with lock:
+            self._check_not_frozen()
+
+            if name in self._state.attrs or name in self._groups:
+                raise ValueError("Duplicate group name: %r" % name)
+
+            # Groups are only looked up once normal attribute lookup has failed,
+            # so a group shadowed by an attribute could never be reached.
+            if hasattr(type(self), name) or name in self.__dict__:
+                raise ValueError("Group name clashes with attribute: %r" % name)
+
+            groups = dict(self._groups)
+            groups[name] = group
+            self._groups = groups
+
+        return group
+
+    def get_groups(self):
+        return list(self._groups.values())
+
+    def freeze(self):
+        """
+        Prevents any further items or transitions being added to this enum,
+        eg. once application startup has completed.
+        """
+
+        self.frozen = True
+
+    def _check_not_frozen(self):
+        if self.frozen:
+            raise TypeError("Cannot modify frozen enum %s" % self.name)
 
     def from_value(self, value):
         if not isinstance(value, int):
@@ -66,7 +281,7 @@ class Enum(list):
             value = int(value)
 
         try:
-            return {x.value: x for x in self}[value]
+            return self._state.values[value]
         except KeyError:
             raise ValueError("%r is not a valid value for enum %s" % (value, self.name))
 
@@ -75,20 +290,156 @@ class Enum(list):
             raise TypeError("item slug should be a str, not %r" % type(slug))
 
         try:
-            return {x.slug.lower(): x for x in self}[slug.lower()]
+            return self._state.slugs[slug.lower()]
         except KeyError:
             raise NoSuchSlugValueError(slug=slug, enum=self)
 
+    def get_item(self, value):
+        """
+        Like ``to_python`` but always returns this enum's own ``Item`` instance
+        and raises ``ValueError`` for empty values or items of other enums.
+        """
+
+        item = self.to_python(value)
+
+        if item is None:
+            raise ValueError("%r is not a valid item for enum %s" % (value, self.name))
+
+        return self.from_value(item.value)
+
+    def transitions(self, graph):
+        """
+        Declare the allowed state transitions as a mapping of source items to
+        an iterable of target items, eg.::
+
+            Status.transitions({
+                Status.PENDING: [Status.RUNNING],
+                Status.RUNNING: [Status.DONE, Status.FAILED],
+            })
+        """
+
+        self._check_not_frozen()
+
+        transitions = {}
+        for source, targets in graph.items():
+            transitions[self.get_item(source)] = frozenset(
+                self.get_item(x) for x in targets
+            )
+
+        self._transitions = transitions
+
+    def get_transition_sources(self, target):
+        """
+        Returns the frozenset of items that are allowed to transition to
+        ``target``.
+        """
+
+        if self._transitions is None:
+            raise ValueError("No transitions declared for enum %s" % self.name)
+
+        target = self.get_item(target)
+
+        return frozenset(x for x, y in self._transitions.items() if target in y)
+
+    def can_transition(self, source, target):
+        return self.get_item(source) in self.get_transition_sources(target)
+
+    def partition(self, iterable, key):
+        """
+        Buckets the objects in ``iterable`` by the item returned by ``key``
+        for each, in one pass. Returns a dict of every item, in the enum's
+        order, to a list of its objects (which may be empty), eg.::
+
+            Status.partition(jobs, operator.attrgetter('status'))
+        """
+
+        state = self._state
+        positions = state.positions
+        buckets = [[] for _ in state.items]
+
+        for obj in iterable:
+            value = key(obj)
+
+            if isinstance(value, Item):
+                value = value.value
+
+            try:
+                idx = positions[value]
+            except (KeyError, TypeError):
+                idx = positions[self.get_item(value).value]
+
+            buckets[idx].append(obj)
+
+        return dict(zip(state.items, buckets))
+
+    def count_by(self, iterable, key):
+        """
+        Like ``partition`` but returns the number of objects for each item.
+        """
+
+        state = self._state
+        positions = state.positions
+        counts = [0] * len(state.items)
+
+        # Count the distinct keys first so that we only resolve each once.
+        for value, num in collections.Counter(map(key, iterable)).items():
+            if isinstance(value, Item):
+                value = value.value
+
+            try:
+                idx = positions[value]
+            except (KeyError, TypeError):
+                idx = positions[self.get_item(value).value]
+
+            counts[idx] += num
+
+        return dict(zip(state.items, counts))
+
     def get_choices(self):
-        return [(x, x.display) for x in self]
+        return list(self._state.choices)
 
-    def to_python(self, value):
-        if value in (None, ""):
-            return None
+    def get_display_expression(self, field):
+        """
+        Returns a ``Case`` expression that maps the values of ``field`` to
+        their display names in the currently active language, for use in
+        ``annotate()`` or ``order_by()``.
+        """
 
+        return models.Case(
+            *[
+                models.When(**{field: x, "then": models.Value(str(x.display))})
+                for x in self
+            ],
+            output_field=models.CharField(),
+        )
+
+    def get_rank_expression(self, field, ordering=None):
+        """
+        Returns a ``Case`` expression that maps the values of ``field`` to their
+        position in ``ordering`` (the order of the enum's items by default),
+        for sorting by a declared order rather than by value.
+        """
+
+        if ordering is None:
+            ordering = self
+
+        return models.Case(
+            *[
+                models.When(**{field: self.get_item(x), "then": models.Value(idx)})
+                for idx, x in enumerate(ordering)
+            ],
+            output_field=models.IntegerField(),
+        )
+
+    def to_python(self, value):
+        # Check for an Item first; comparing one against the empty values goes
+        # through Item.__eq__ and is comparatively expensive.
         if isinstance(value, Item):
             return value
 
+        if value is None or value == "":
+            return None
+
         try:
             return self.from_value(value)
         except ValueError:
@@ -102,3 +453,51 @@ class Enum(list):
         raise ValueError(
             "%r is not a valid slug or value for enum %s" % (value, self.name)
         )
+
+
+class LazyEnum(Enum):
+    """
+    An enum whose items are only created, by calling ``loader``, when the enum
+    is first used. This is useful for large enums generated from data files::
+
+        ErrorCode = LazyEnum('ErrorCode', lambda: [
+            Item(int(x), slug, display) for x, slug, display in read_rows()
+        ])
+    """
+
+    def __init__(self, name, loader):
+        self.loader = loader
+
+        super(LazyEnum, self).__init__(name)
+
+        # Discard the empty snapshot so that the first access loads the items.
+        del self._state
+
+    def __getattr__(self, name):
+        if name == "_state":
+            self.load()
+            return self._state
+
+        return super(LazyEnum, self).__getattr__(name)
+
+    def __repr__(self):
+        if not self.loaded:
+            return "<%s: (not loaded)>" % self.name
+
+        return super(LazyEnum, self).__repr__()
+
+    def load(self):
+        with lock:
+            if self.loaded:
+                return
+
+            try:
+                items = tuple(self.loader())
+                state = self._extend_state(EnumState(()), items)
+            except Exception as exc:
+                raise EnumLoadError(
+                    "Could not load items of enum %s: %s" % (self.name, exc)
+                ) from exc
+
+            list.extend(self, items)
+            self._state = state
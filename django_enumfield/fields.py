@@ -1,14 +1,58 @@
+from django import forms
+from django.core import exceptions
 from django.db import models
 
+from .item import Item
+from .forms import EnumChoiceField
+from .lookups import Has, HasAll, HasAny
+
+
+class LazyChoices:
+    """
+    Iterable of an enum's choices that only loads a ``LazyEnum`` when the
+    choices are actually used.
+    """
+
+    def __init__(self, enum):
+        self.enum = enum
+
+    def __iter__(self):
+        return iter(self.enum.get_choices())
+
+    def __len__(self):
+        return len(self.enum)
+
+    def __bool__(self):
+        return True
+
 
 class EnumField(models.Field):
-    def __init__(self, enum, *args, **kwargs):
+    def __init__(self, enum, *args, serialize_slugs=False, **kwargs):
         self.enum = enum
 
-        kwargs.setdefault("choices", enum.get_choices())
+        # Whether dumpdata etc. should write slugs rather than values. Loading
+        # accepts either, looking them up in the enum's value and slug indexes.
+        self.serialize_slugs = serialize_slugs
+
+        # If the choices are the enum's own we can validate against its
+        # indexes instead of scanning the choices.
+        self._enum_choices = "choices" not in kwargs
+
+        # Avoid forcing a LazyEnum to load when the model is defined.
+        kwargs.setdefault(
+            "choices", enum.get_choices() if enum.loaded else LazyChoices(enum)
+        )
 
         super(EnumField, self).__init__(*args, **kwargs)
 
+    def _check_choices(self):
+        # The enum's own choices are valid by construction, and walking them
+        # would load a LazyEnum whenever the system checks run.
+        if self._enum_choices:
+            return []
+
+        return super(EnumField, self)._check_choices()
+
     def get_internal_type(self):
         return "IntegerField"
 
@@ -18,7 +62,56 @@ class EnumField(models.Field):
     def from_db_value(self, value, expression, connection, *args, **kwargs):
         return self.to_python(value)
 
+    def clean(self, value, model_instance):
+        try:
+            value = self.to_python(value)
+        except ValueError:
+            raise exceptions.ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+        self.validate(value, model_instance)
+        self.run_validators(value)
+
+        return value
+
+    def validate(self, value, model_instance):
+        if not self._enum_choices:
+            return super(EnumField, self).validate(value, model_instance)
+
+        if not self.editable:
+            return
+
+        if value not in self.empty_values and value not in self.enum:
+            raise exceptions.ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+        if value is None and not self.null:
+            raise exceptions.ValidationError(self.error_messages["null"], code="null")
+
+        if not self.blank and value in self.empty_values:
+            raise exceptions.ValidationError(self.error_messages["blank"], code="blank")
+
+    def formfield(self, **kwargs):
+        if self._enum_choices:
+            kwargs.setdefault("choices_form_class", EnumChoiceField)
+
+        return super(EnumField, self).formfield(**kwargs)
+
     def get_prep_value(self, value):
+        # Fast paths for values that are already an Item or a plain int so
+        # that saving does not need to go through Enum.to_python.
+        if isinstance(value, Item):
+            return value.value
+
+        if type(value) is int:
+            return self.enum.from_value(value).value
+
         python_value = self.to_python(value)
 
         if python_value is None:
@@ -27,23 +120,35 @@ class EnumField(models.Field):
         return python_value.value
 
     def get_prep_lookup(self, lookup_type, value):
-        def prepare(value):
-            x = self.to_python(value)
-
-            return self.get_prep_value(x)
-
         if lookup_type in ("exact", "lt", "lte", "gt", "gte"):
-            return prepare(value)
+            return self.get_prep_value(value)
         if lookup_type == "in":
-            return [prepare(v) for v in value]
+            return [self.get_prep_value(v) for v in value]
         if lookup_type == "isnull":
             return value
 
         raise TypeError("Lookup type %r not supported." % lookup_type)
 
+    def get_display_expression(self):
+        return self.enum.get_display_expression(self.name)
+
+    def get_rank_expression(self, ordering=None):
+        return self.enum.get_rank_expression(self.name, ordering)
+
     def value_to_string(self, obj):
-        item = self.value_from_object(obj)
-        return str(item.value)
+        # Used by the serializers, so avoid Enum.to_python where we can.
+        value = getattr(obj, self.attname)
+
+        if value is None:
+            return None
+
+        if not isinstance(value, Item):
+            value = self.enum.from_value(self.get_prep_value(value))
+
+        if self.serialize_slugs:
+            return value.slug
+
+        return str(value.value)
 
     def clone(self):
         _, _, args, kwargs = self.deconstruct()
@@ -69,3 +174,123 @@ class EnumField(models.Field):
         del kwargs["choices"]
 
         return name, "django.db.models.IntegerField", args, kwargs
+
+
+class EnumSetField(models.Field):
+    """
+    Stores a set of items from an enum as a bitmask, using each item's value
+    as its bit position. Values are returned as a ``frozenset`` of the enum's
+    items.
+    """
+
+    # Highest bit position we can use in a signed 64-bit column.
+    MAX_VALUE = 62
+
+    def __init__(self, enum, *args, **kwargs):
+        self.enum = enum
+
+        # Items of a LazyEnum are checked as they are encoded instead, so that
+        # defining the field does not load it.
+        if enum.loaded:
+            for x in enum:
+                self.check_item(x)
+
+        super(EnumSetField, self).__init__(*args, **kwargs)
+
+    def check_item(self, item):
+        if not 0 <= item.value <= self.MAX_VALUE:
+            raise ValueError(
+                "%r cannot be used in an EnumSetField; item values must be "
+                "between 0 and %d" % (item, self.MAX_VALUE)
+            )
+
+    def get_internal_type(self):
+        return "BigIntegerField"
+
+    def decode(self, mask):
+        result = []
+
+        while mask:
+            lowest = mask & -mask
+            result.append(self.enum.from_value(lowest.bit_length() - 1))
+            mask ^= lowest
+
+        return frozenset(result)
+
+    def encode(self, items):
+        mask = 0
+
+        for x in items:
+            item = self.enum.get_item(x)
+            self.check_item(item)
+            mask |= 1 << item.value
+
+        return mask
+
+    def to_python(self, value):
+        if value is None:
+            return None
+
+        if isinstance(value, Item):
+            value = (value,)
+        elif isinstance(value, str):
+            # A serialised bitmask
+            value = int(value) if value else 0
+
+        if isinstance(value, int):
+            return self.decode(value)
+
+        return frozenset(self.enum.get_item(x) for x in value)
+
+    def from_db_value(self, value, expression, connection, *args, **kwargs):
+        if value is None:
+            return None
+
+        return self.decode(value)
+
+    def get_prep_value(self, value):
+        if value is None:
+            return None
+
+        if isinstance(value, int):
+            # Already a bitmask; check it only contains valid bits.
+            return self.encode(self.decode(value))
+
+        return self.encode(self.to_python(value))
+
+    def value_to_string(self, obj):
+        mask = self.get_prep_value(self.value_from_object(obj))
+
+        return None if mask is None else str(mask)
+
+    def formfield(self, **kwargs):
+        defaults = {
+            "form_class": forms.TypedMultipleChoiceField,
+            "choices": self.enum.get_choices(),
+            "coerce": self.enum.get_item,
+        }
+        defaults.update(kwargs)
+
+        return super(EnumSetField, self).formfield(**defaults)
+
+    def clone(self):
+        _, _, args, kwargs = self.deconstruct()
+        return models.BigIntegerField(*args, **kwargs)
+
+    def deconstruct(self):
+        name, _, args, kwargs = super(EnumSetField, self).deconstruct()
+
+        # Store defaults as their bitmask so that we do not need to serialise
+        # the enum or its items for migrations.
+        default = kwargs.get("default")
+        if callable(default):
+            default = default()
+        if "default" in kwargs:
+            kwargs["default"] = self.get_prep_value(default)
+
+        return name, "django.db.models.BigIntegerField", args, kwargs
+
+
+EnumSetField.register_lookup(Has)
+EnumSetField.register_lookup(HasAll)
+EnumSetField.register_lookup(HasAny)
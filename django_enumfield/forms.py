@@ -0,0 +1,47 @@
+from django import forms
+from django.core.exceptions import ValidationError
+
+
+class EnumChoiceField(forms.TypedChoiceField):
+    """
+    Form field used by ``EnumField`` that parses the submitted value exactly
+    once via ``coerce`` and checks membership against the enum's indexes
+    instead of scanning every choice.
+    """
+
+    def __init__(self, **kwargs):
+        super(EnumChoiceField, self).__init__(**kwargs)
+
+        # The choices we were created with are the enum's own. Assigning any
+        # others later, eg. to narrow them in a form's __init__, clears this.
+        self._enum_choices = True
+
+    def _set_choices(self, value):
+        forms.ChoiceField._set_choices(self, value)
+        self._enum_choices = False
+
+    choices = property(forms.ChoiceField._get_choices, _set_choices)
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return self.empty_value
+
+        try:
+            return self.coerce(value)
+        except (ValueError, TypeError):
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+    def validate(self, value):
+        if not self._enum_choices:
+            return super(EnumChoiceField, self).validate(value)
+
+        # ``to_python`` has already rejected values that are not in the enum,
+        # so skip ChoiceField.valid_value's linear scan.
+        forms.Field.validate(self, value)
+
+    def _coerce(self, value):
+        return value
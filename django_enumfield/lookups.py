@@ -0,0 +1,48 @@
+from django.db import models
+
+
+class BitmaskLookup(models.Lookup):
+    """
+    Base class for lookups on ``EnumSetField`` that compare the column against
+    a bitmask of items using the backend's bitwise AND.
+    """
+
+    template = None
+
+    def get_prep_lookup(self):
+        if hasattr(self.rhs, "resolve_expression"):
+            return self.rhs
+
+        return self.lhs.output_field.get_prep_value(self.rhs)
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+
+        bitand = connection.ops.combine_expression("&", [lhs, rhs])
+
+        return (
+            self.template % {"bitand": bitand, "rhs": rhs},
+            # The rhs appears once inside bitand and possibly in the template
+            list(lhs_params) + list(rhs_params) * (1 + self.template.count("%(rhs)s")),
+        )
+
+
+class HasAll(BitmaskLookup):
+    lookup_name = "has_all"
+    template = "(%(bitand)s) = %(rhs)s"
+
+
+class HasAny(BitmaskLookup):
+    lookup_name = "has_any"
+    template = "(%(bitand)s) <> 0"
+
+
+class Has(HasAll):
+    lookup_name = "has"
+
+    def get_prep_lookup(self):
+        if hasattr(self.rhs, "resolve_expression"):
+            return self.rhs
+
+        return self.lhs.output_field.get_prep_value([self.rhs])
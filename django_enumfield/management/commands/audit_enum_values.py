@@ -0,0 +1,118 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, models
+
+from ...fields import EnumField
+
+
+class Command(BaseCommand):
+    help = (
+        "Reports values stored in EnumField columns that are not valid items "
+        "of their enum, without loading any model instances."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "app_label",
+            nargs="*",
+            help="Only audit models in these apps.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database to audit. Defaults to the 'default' database.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100000,
+            help="Number of primary keys to scan per query.",
+        )
+
+    def handle(self, *app_labels, **options):
+        self.verbosity = options["verbosity"]
+
+        if app_labels:
+            app_configs = [apps.get_app_config(x) for x in app_labels]
+        else:
+            app_configs = apps.get_app_configs()
+
+        num_invalid = 0
+
+        for app_config in app_configs:
+            for model in app_config.get_models():
+                if model._meta.proxy:
+                    continue
+
+                for field in model._meta.local_concrete_fields:
+                    if not isinstance(field, EnumField):
+                        continue
+
+                    invalid = self.audit(model, field, **options)
+                    num_invalid += sum(invalid.values())
+
+                    self.report(model, field, invalid)
+
+        if num_invalid:
+            raise CommandError("Found %d rows with invalid enum values" % num_invalid)
+
+    def audit(self, model, field, database, batch_size, **options):
+        """
+        Returns a mapping of invalid values in ``field`` to the number of rows
+        that contain them.
+        """
+
+        base_qs = model._base_manager.using(database).order_by()
+        qs = base_qs.filter(**{"%s__isnull" % field.attname: False}).exclude(
+            **{"%s__in" % field.attname: [x.value for x in field.enum]}
+        )
+
+        # Take the bounds from the whole table, which the database can answer
+        # from the primary key index alone, rather than scanning it for invalid
+        # values only to then scan each chunk again.
+        bounds = base_qs.aggregate(min_pk=models.Min("pk"), max_pk=models.Max("pk"))
+        min_pk, max_pk = bounds["min_pk"], bounds["max_pk"]
+
+        if min_pk is None:
+            return {}
+
+        if isinstance(min_pk, int) and batch_size:
+            chunks = [
+                qs.filter(pk__gte=x, pk__lt=x + batch_size)
+                for x in range(min_pk, max_pk + 1, batch_size)
+            ]
+        else:
+            chunks = [qs]
+
+        result = {}
+
+        for chunk in chunks:
+            # Wrap the column so that the raw integer is returned rather than
+            # being passed through EnumField.from_db_value, which would raise.
+            rows = chunk.values_list(
+                models.ExpressionWrapper(
+                    models.F(field.attname),
+                    output_field=models.IntegerField(),
+                ),
+            ).annotate(count=models.Count("*"))
+
+            for value, count in rows:
+                result[value] = result.get(value, 0) + count
+
+        return result
+
+    def report(self, model, field, invalid):
+        name = "%s.%s" % (model._meta.label, field.name)
+
+        if not invalid:
+            if self.verbosity >= 2:
+                self.stdout.write("%s: OK" % name)
+            return
+
+        self.stdout.write(
+            "%s: %s"
+            % (
+                name,
+                ", ".join("%r (%d rows)" % (x, y) for x, y in sorted(invalid.items())),
+            )
+        )
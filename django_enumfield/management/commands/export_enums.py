@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...views import get_enums_json
+
+
+class Command(BaseCommand):
+    help = "Writes every enum as JSON, in the same format as the enums_json view."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--language",
+            default=settings.LANGUAGE_CODE,
+            help="Language to use for display names. Defaults to LANGUAGE_CODE.",
+        )
+
+    def handle(self, *args, **options):
+        content, _ = get_enums_json(options["language"])
+
+        self.stdout.write(content.decode("utf-8"))
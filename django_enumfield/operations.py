@@ -0,0 +1,111 @@
+from django.db import models, router
+from django.db.migrations.operations.base import Operation
+
+
+class RemapEnumValues(Operation):
+    """
+    Migration operation that rewrites the values stored in an enum column
+    according to ``mapping`` (old value to new value), eg. when renumbering
+    or merging items::
+
+        operations = [
+            RemapEnumValues('Job', 'status', {10: 1, 20: 2, 30: 2}),
+        ]
+
+    Rows are updated with one ``UPDATE ... SET col = CASE ... END`` statement
+    per ``batch_size`` range of primary keys. If given, ``progress`` is called
+    with the number of rows updated so far after every batch.
+
+    Like any other operation, all batches run in the migration's transaction
+    unless the migration sets ``atomic = False``, in which case each batch is
+    committed as soon as it has been written.
+
+    The operation is only reversible if ``mapping`` permutes its own keys (eg.
+    ``{1: 3, 3: 1}``). Otherwise rows that already held a target value could
+    not be told apart from the remapped ones when migrating backwards.
+    """
+
+    reduces_to_sql = False
+
+    def __init__(self, model_name, name, mapping, batch_size=10000, progress=None):
+        self.model_name = model_name
+        self.name = name
+        self.mapping = {int(x): int(y) for x, y in mapping.items()}
+        self.batch_size = batch_size
+        self.progress = progress
+
+    @property
+    def reversible(self):
+        return sorted(self.mapping.values()) == sorted(self.mapping)
+
+    def deconstruct(self):
+        kwargs = {
+            "model_name": self.model_name,
+            "name": self.name,
+            "mapping": self.mapping,
+            "batch_size": self.batch_size,
+        }
+
+        if self.progress is not None:
+            kwargs["progress"] = self.progress
+
+        return (self.__class__.__name__, [], kwargs)
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        self.remap(model, schema_editor.connection.alias, self.mapping)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        self.remap(
+            model,
+            schema_editor.connection.alias,
+            {y: x for x, y in self.mapping.items()},
+        )
+
+    def remap(self, model, using, mapping):
+        if not mapping or not router.allow_migrate_model(using, model):
+            return
+
+        name = model._meta.get_field(self.name).attname
+        qs = model._base_manager.using(using).filter(
+            **{"%s__in" % name: sorted(mapping)}
+        )
+        value = models.Case(
+            *[
+                models.When(**{name: x, "then": models.Value(y)})
+                for x, y in mapping.items()
+            ],
+            output_field=models.IntegerField(),
+        )
+
+        bounds = qs.aggregate(min_pk=models.Min("pk"), max_pk=models.Max("pk"))
+        min_pk, max_pk = bounds["min_pk"], bounds["max_pk"]
+
+        if min_pk is None:
+            return
+
+        if not isinstance(min_pk, int) or not self.batch_size:
+            # Cannot batch by primary key range
+            rows = qs.update(**{name: value})
+            if self.progress is not None:
+                self.progress(rows)
+            return
+
+        rows = 0
+        for start in range(min_pk, max_pk + 1, self.batch_size):
+            rows += qs.filter(pk__gte=start, pk__lt=start + self.batch_size).update(
+                **{name: value}
+            )
+            if self.progress is not None:
+                self.progress(rows)
+
+    def describe(self):
+        return "Remap values of %s.%s" % (self.model_name, self.name)
+
+    @property
+    def migration_name_fragment(self):
+        return "remap_%s_%s" % (self.model_name.lower(), self.name.lower())
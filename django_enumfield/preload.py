@@ -0,0 +1,36 @@
+from django.conf import settings
+
+from .views import get_enums_json
+from .encoders import item_to_json
+from .context_processors import get_enums
+
+
+def preload(languages=None):
+    """
+    Fully materialises every enum found by ``get_enums``, including loading
+    any ``LazyEnum``, caching each item's ``object`` JSON representation and
+    encoding the JSON returned by ``get_enums_json`` for each of
+    ``languages`` (``LANGUAGE_CODE`` by default).
+
+    Call this in the master process of a preforking server (eg. from
+    gunicorn's ``when_ready`` hook with ``preload_app``) so that the work is
+    done once and the resulting objects are shared copy-on-write between
+    workers rather than being rebuilt in each of them.
+    """
+
+    if languages is None:
+        languages = [settings.LANGUAGE_CODE]
+
+    enums = [x for app_enums in get_enums().values() for x in app_enums.values()]
+
+    for enum in enums:
+        # Builds the snapshot of a LazyEnum, along with its indexes and choices
+        len(enum)
+
+    for language in languages:
+        for enum in enums:
+            for x in enum:
+                # Evaluates the display and caches it on the item
+                item_to_json(x, "object", language)
+
+        get_enums_json(language)
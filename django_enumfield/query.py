@@ -0,0 +1,77 @@
+from django.db import connections, models, transaction
+
+from .fields import EnumField
+
+
+class EnumQuerySet(models.QuerySet):
+    def bulk_update_enum(self, objs, fields, batch_size=None):
+        """
+        Like ``bulk_update`` but for ``EnumField`` columns. As these only have
+        a handful of distinct values, objects are grouped by their items and
+        each group is written with ``UPDATE ... WHERE pk IN (...)`` instead of
+        a ``CASE`` clause per row.
+        """
+
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("Batch size must be a positive integer.")
+        if not fields:
+            raise ValueError("Field names must be given to bulk_update_enum().")
+
+        fields = [self.model._meta.get_field(x) for x in fields]
+        if any(not isinstance(x, EnumField) for x in fields):
+            raise ValueError("bulk_update_enum() can only be used with EnumFields.")
+
+        # Group on the raw attribute values first so that we only prepare each
+        # distinct value once, then merge groups that prepare to the same
+        # values (eg. an Item and its slug).
+        groups = {}
+        for obj in objs:
+            if obj.pk is None:
+                raise ValueError(
+                    "All bulk_update_enum() objects must have a primary key set."
+                )
+            key = tuple(getattr(obj, x.attname) for x in fields)
+            groups.setdefault(key, []).append(obj.pk)
+
+        pks_by_values = {}
+        for key, pks in groups.items():
+            values = tuple(x.get_prep_value(y) for x, y in zip(fields, key))
+            pks_by_values.setdefault(values, []).extend(pks)
+
+        rows_updated = 0
+        with transaction.atomic(using=self.db, savepoint=False):
+            for values, pks in pks_by_values.items():
+                max_batch_size = connections[self.db].ops.bulk_batch_size(["pk"], pks)
+                size = min(batch_size, max_batch_size) if batch_size else max_batch_size
+                kwargs = {x.attname: y for x, y in zip(fields, values)}
+
+                for idx in range(0, len(pks), size):
+                    rows_updated += self.filter(pk__in=pks[idx : idx + size]).update(
+                        **kwargs
+                    )
+
+        return rows_updated
+
+    def transition(self, field, target):
+        """
+        Moves every row in this queryset whose ``field`` is currently in one of
+        the states that may transition to ``target`` (according to the graph
+        declared with ``Enum.transitions``) into ``target``.
+
+        This is performed as a single conditional ``UPDATE`` so no row locks
+        are required. Returns the number of rows that were transitioned.
+        """
+
+        field = self.model._meta.get_field(field)
+        if not isinstance(field, EnumField):
+            raise ValueError("transition() can only be used with EnumFields.")
+
+        target = field.enum.get_item(target)
+        sources = sorted(field.enum.get_transition_sources(target))
+
+        if not sources:
+            return 0
+
+        return self.filter(**{"%s__in" % field.name: sources}).update(
+            **{field.attname: target}
+        )
@@ -0,0 +1,12 @@
+"""
+Optional app that keeps a reference table of every enum's items in the
+database, so that reports written in SQL can decode and label enum columns.
+
+Add ``django_enumfield.reference`` to ``INSTALLED_APPS``; the table is then
+synchronised after every ``migrate``.
+"""
+
+import django
+
+if django.VERSION < (3, 2):
+    default_app_config = "django_enumfield.reference.apps.ReferenceConfig"
@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+class ReferenceConfig(AppConfig):
+    name = "django_enumfield.reference"
+    label = "enumfield_reference"
+    verbose_name = "Enum reference tables"
+    default_auto_field = "django.db.models.AutoField"
+
+    def ready(self):
+        from .sync import sync_on_migrate
+
+        post_migrate.connect(sync_on_migrate, sender=self)
@@ -0,0 +1,27 @@
+# Generated by Django 4.0 on 2026-10-19 09:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EnumItem',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('enum', models.CharField(max_length=255)),
+                ('value', models.IntegerField()),
+                ('slug', models.CharField(max_length=255)),
+                ('display', models.CharField(max_length=255)),
+            ],
+            options={
+                'unique_together': {('enum', 'value')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.0 on 2026-10-19 09:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('enumfield_reference', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='enumitem',
+            name='display',
+            field=models.TextField(),
+        ),
+        migrations.AlterField(
+            model_name='enumitem',
+            name='slug',
+            field=models.TextField(),
+        ),
+    ]
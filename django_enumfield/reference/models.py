@@ -0,0 +1,19 @@
+from django.db import models
+
+
+class EnumItem(models.Model):
+    """
+    One row per item of every enum found by ``get_enums``. ``enum`` is of the
+    form ``app_name.EnumName``.
+    """
+
+    enum = models.CharField(max_length=255)
+    value = models.IntegerField()
+    slug = models.TextField()
+    display = models.TextField()
+
+    class Meta:
+        unique_together = (("enum", "value"),)
+
+    def __str__(self):
+        return "%s.%s" % (self.enum, self.slug)
@@ -0,0 +1,86 @@
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, models, router, transaction
+from django.utils import translation
+
+from ..context_processors import get_enums
+from .models import EnumItem
+
+
+def get_enum_key(enum):
+    """
+    Returns the ``EnumItem.enum`` key for ``enum``.
+    """
+
+    for app_name, enums in get_enums().items():
+        for name, x in enums.items():
+            if x is enum:
+                return "%s.%s" % (app_name, name)
+
+    raise ValueError("%s is not in an enums module of an installed app" % enum.name)
+
+
+def sync_reference_table(using=DEFAULT_DB_ALIAS):
+    """
+    Brings the ``EnumItem`` table in line with the enums found by
+    ``get_enums``, only writing rows that have changed. Displays use
+    ``LANGUAGE_CODE``.
+    """
+
+    if not router.allow_migrate_model(using, EnumItem):
+        return
+
+    with translation.override(settings.LANGUAGE_CODE):
+        expected = {
+            ("%s.%s" % (app_name, name), x.value): (x.slug, str(x.display))
+            for app_name, enums in get_enums().items()
+            for name, enum in enums.items()
+            for x in enum
+        }
+
+    qs = EnumItem.objects.using(using)
+
+    with transaction.atomic(using=using, savepoint=False):
+        existing = {(x.enum, x.value): x for x in qs.all()}
+
+        to_create = []
+        to_update = []
+        for key, (slug, display) in expected.items():
+            obj = existing.get(key)
+
+            if obj is None:
+                to_create.append(
+                    EnumItem(enum=key[0], value=key[1], slug=slug, display=display)
+                )
+            elif (obj.slug, obj.display) != (slug, display):
+                obj.slug = slug
+                obj.display = display
+                to_update.append(obj)
+
+        to_delete = [x.pk for key, x in existing.items() if key not in expected]
+
+        if to_create:
+            qs.bulk_create(to_create)
+        if to_update:
+            qs.bulk_update(to_update, ["slug", "display"])
+        if to_delete:
+            qs.filter(pk__in=to_delete).delete()
+
+
+def sync_on_migrate(app_config, using=DEFAULT_DB_ALIAS, **kwargs):
+    sync_reference_table(using)
+
+
+def reference_subquery(enum, field, column="display"):
+    """
+    Returns a subquery selecting ``column`` of the reference row for the
+    value of ``field``, for use in ``annotate()``, eg.::
+
+        Job.objects.annotate(status_display=reference_subquery(Status, 'status'))
+    """
+
+    return models.Subquery(
+        EnumItem.objects.filter(
+            enum=get_enum_key(enum),
+            value=models.OuterRef(field),
+        ).values(column)[:1]
+    )
@@ -0,0 +1,57 @@
+import json
+import hashlib
+import functools
+
+from django.http import HttpResponse
+from django.utils import translation
+from django.views.decorators.http import condition, require_safe
+from django.views.decorators.vary import vary_on_headers
+
+from .context_processors import get_enums
+
+
+def get_enums_json(language):
+    """
+    Returns a tuple of the JSON-encoded bytes of every enum found by
+    ``get_enums`` with displays in ``language``, and an ETag for them.
+
+    The result is cached until items are next added to one of these enums.
+    """
+
+    # Items can only be appended to an enum, so its length changes whenever
+    # its items do.
+    lengths = tuple(len(x) for enums in get_enums().values() for x in enums.values())
+
+    return _get_enums_json(language, lengths)
+
+
+@functools.lru_cache()
+def _get_enums_json(language, lengths):
+    with translation.override(language):
+        data = {
+            app_name: {
+                name: [
+                    {"value": x.value, "slug": x.slug, "display": str(x.display)}
+                    for x in items
+                ]
+                for name, items in enums.items()
+            }
+            for app_name, enums in get_enums().items()
+        }
+
+    content = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+    return content, '"%s"' % hashlib.sha256(content).hexdigest()
+
+
+def get_etag(request):
+    return get_enums_json(translation.get_language())[1]
+
+
+@require_safe
+@vary_on_headers("Accept-Language", "Cookie")
+@condition(etag_func=get_etag)
+def enums_json(request):
+    content, _ = get_enums_json(translation.get_language())
+
+    return HttpResponse(content, content_type="application/json")
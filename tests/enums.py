@@ -1,4 +1,4 @@
-from django_enumfield import Enum, Item
+from django_enumfield import Enum, Item, LazyEnum
 
 
 TestModelEnum = Enum(
@@ -6,3 +6,33 @@ TestModelEnum = Enum(
     Item(10, 'a', "Item A"),
     Item(20, 'b', "Item B"),
 )
+
+
+StatusEnum = Enum(
+    'StatusEnum',
+    Item(1, 'pending', "Pending"),
+    Item(2, 'running', "Running"),
+    Item(3, 'done', "Done"),
+    Item(4, 'failed', "Failed"),
+)
+
+StatusEnum.transitions({
+    StatusEnum.PENDING: [StatusEnum.RUNNING],
+    StatusEnum.RUNNING: [StatusEnum.DONE, StatusEnum.FAILED],
+    StatusEnum.FAILED: [StatusEnum.PENDING],
+})
+
+StatusEnum.group('OPEN', StatusEnum.PENDING, StatusEnum.RUNNING)
+
+
+# Has items added to it at runtime by the tests.
+ExtensibleEnum = Enum(
+    'ExtensibleEnum',
+    Item(1, 'first', "First"),
+)
+
+
+LargeEnum = LazyEnum(
+    'LargeEnum',
+    lambda: [Item(x, 'item_%d' % x, "Item %d" % x) for x in range(1000)],
+)
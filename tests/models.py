@@ -1,16 +1,19 @@
 import random
 
-from django_enumfield import EnumField
+from django_enumfield import EnumField, EnumSetField
+from django_enumfield.query import EnumQuerySet
 
 from django.db import models
 
-from .enums import TestModelEnum
+from .enums import StatusEnum, TestModelEnum
 
 
 class TestModel(models.Model):
     test_field = EnumField(TestModelEnum, default=TestModelEnum.A)
     test_field_no_default = EnumField(TestModelEnum)
 
+    objects = EnumQuerySet.as_manager()
+
 
 class TestModelNull(models.Model):
     test_field_null = EnumField(TestModelEnum, null=True)
@@ -22,3 +25,18 @@ def random_default():
 
 class TestModelRandomDefault(models.Model):
     test_field = EnumField(TestModelEnum, default=random_default)
+
+
+class TestModelStatus(models.Model):
+    status = EnumField(StatusEnum, default=StatusEnum.PENDING)
+
+    objects = EnumQuerySet.as_manager()
+
+
+class TestModelSet(models.Model):
+    test_field = EnumSetField(TestModelEnum, default=frozenset())
+    test_field_null = EnumSetField(TestModelEnum, null=True)
+
+
+class TestModelSlug(models.Model):
+    status = EnumField(StatusEnum, null=True, serialize_slugs=True)
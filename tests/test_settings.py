@@ -1,5 +1,7 @@
 SECRET_KEY = 'fake-key'
 INSTALLED_APPS = [
+    'django_enumfield',
+    'django_enumfield.reference',
     'tests',
     'tests.app',
 ]
@@ -1,19 +1,78 @@
+import io
+import os
+import copy
+import pickle
+import json
 import unittest
-
-from django.db import models
+import tempfile
+import threading
+import tracemalloc
+import weakref
+from unittest import mock
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import connection, models
 from django.db.utils import IntegrityError
 from django.core import serializers
+from django.core.management import CommandError, call_command
 from django.http import HttpRequest, Http404
-from django.test import TestCase as DjangoTestCase, override_settings
+from django.apps import apps
+from django.contrib.admin import AdminSite, ModelAdmin
+from django.conf import settings
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext, isolate_apps
+from django.db.migrations.state import ProjectState
+from django.test import (
+    TestCase as DjangoTestCase,
+    TransactionTestCase,
+    override_settings,
+)
 from django.template.loader import render_to_string
 from django.db.models.fields import NOT_PROVIDED
+from django.utils import translation
+from django.utils.functional import lazy
 from django.utils.translation import gettext_lazy as _
 
-from django_enumfield import Enum, Item, get_enum_or_404
+from django_enumfield import (
+    Enum,
+    EnumField,
+    EnumSetField,
+    Item,
+    LazyEnum,
+    get_enum_or_404,
+    preload,
+)
+from django_enumfield.admin import EnumFieldListFilter
+from django_enumfield.context_processors import get_enums
+from django_enumfield.encoders import (
+    EnumJSONEncoder,
+    EnumJsonResponse,
+    get_encoder,
+    item_to_json,
+)
+from django_enumfield.enum import EnumLoadError
+from django_enumfield.forms import EnumChoiceField
+from django_enumfield.operations import RemapEnumValues
+from django_enumfield.views import get_enums_json
+from django_enumfield.reference.models import EnumItem
+from django_enumfield.reference.sync import (
+    get_enum_key,
+    reference_subquery,
+    sync_reference_table,
+)
 from django_enumfield.utils import TemplateErrorException
 
-from .enums import TestModelEnum
-from .models import TestModel, TestModelNull, TestModelRandomDefault
+from .enums import ExtensibleEnum, LargeEnum, StatusEnum, TestModelEnum
+from .models import (
+    TestModel,
+    TestModelNull,
+    TestModelRandomDefault,
+    TestModelSet,
+    TestModelSlug,
+    TestModelStatus,
+)
 
 
 class ItemTests(unittest.TestCase):
@@ -98,6 +157,24 @@ class EnumConstructionTests(unittest.TestCase):
         self.assertEqual(FooEnum.B.display, "Item B")
         self.assertEqual(FooEnum.from_value(10).slug, 'a')
 
+    def test_add_items(self):
+        FooEnum = Enum('FooEnum')
+        FooEnum.add_items([
+            Item(10, 'a', "Item A"),
+            Item(20, 'b', "Item B"),
+        ])
+
+        self.assertEqual(len(FooEnum), 2)
+        self.assertEqual(FooEnum.B.display, "Item B")
+
+        with self.assertRaises(ValueError):
+            FooEnum.add_items([
+                Item(30, 'c', "Item C"),
+                Item(40, 'C', "Item C"),
+            ])
+
+        self.assertEqual(len(FooEnum), 2)
+
     def test_dynamic_enum_rejects_duplicate_value(self):
         FooEnum = Enum('FooEnum')
         FooEnum.add_item(Item(10, 'a', "Item A"))
@@ -112,6 +189,103 @@ class EnumConstructionTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             FooEnum.add_item(Item(20, 'a', "Item B"))
 
+    def test_dynamic_enum_snapshot(self):
+        FooEnum = Enum('FooEnum', Item(10, 'a', "Item A"))
+
+        it = iter(FooEnum)
+        choices = FooEnum.get_choices()
+        FooEnum.add_item(Item(20, 'b', "Item B"))
+
+        self.assertEqual(list(it), [FooEnum.A])
+        self.assertEqual(choices, [(FooEnum.A, "Item A")])
+        self.assertEqual(list(FooEnum), [FooEnum.A, FooEnum.B])
+        self.assertEqual(FooEnum[-1], FooEnum.B)
+        self.assertEqual(list.__len__(FooEnum), 2)
+
+    def test_dynamic_enum_concurrent_reads(self):
+        FooEnum = Enum('FooEnum', Item(0, 'item_0', "Item 0"))
+        errors = []
+
+        def add_items():
+            for x in range(1, 200):
+                FooEnum.add_item(Item(x, 'item_%d' % x, "Item %d" % x))
+
+        thread = threading.Thread(target=add_items)
+        thread.start()
+
+        while thread.is_alive():
+            for x in FooEnum:
+                if FooEnum.from_value(x.value) is not x:
+                    errors.append(x)
+                if getattr(FooEnum, x.slug.upper()) is not x:
+                    errors.append(x)
+
+        thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(FooEnum), 200)
+
+    def test_freeze(self):
+        FooEnum = Enum('FooEnum', Item(10, 'a', "Item A"))
+        FooEnum.freeze()
+
+        with self.assertRaises(TypeError):
+            FooEnum.add_item(Item(20, 'b', "Item B"))
+
+        with self.assertRaises(TypeError):
+            FooEnum.transitions({FooEnum.A: [FooEnum.A]})
+
+        self.assertEqual(list(FooEnum), [FooEnum.A])
+
+    def test_list_methods(self):
+        FooEnum = Enum('FooEnum', Item(10, 'a', "Item A"))
+
+        FooEnum.append(Item(20, 'b', "Item B"))
+        FooEnum.extend([Item(30, 'c', "Item C")])
+        FooEnum += [Item(40, 'd', "Item D")]
+
+        self.assertEqual(FooEnum.from_value(40), FooEnum.D)
+        self.assertEqual([x.value for x in FooEnum], [10, 20, 30, 40])
+
+        with self.assertRaises(ValueError):
+            FooEnum.append(Item(10, 'e', "Item E"))
+
+        for fn in (
+            lambda: FooEnum.insert(0, Item(50, 'e', "Item E")),
+            lambda: FooEnum.__setitem__(0, Item(50, 'e', "Item E")),
+            lambda: FooEnum.__delitem__(0),
+            lambda: FooEnum.__imul__(2),
+            lambda: FooEnum.sort(),
+            lambda: FooEnum.reverse(),
+            lambda: FooEnum.remove(FooEnum.A),
+            lambda: FooEnum.pop(),
+            lambda: FooEnum.clear(),
+        ):
+            with self.assertRaises(TypeError):
+                fn()
+
+        self.assertEqual([x.value for x in FooEnum], [10, 20, 30, 40])
+        self.assertEqual(list.__len__(FooEnum), 4)
+
+    def test_copy(self):
+        FooEnum = Enum('FooEnum', Item(10, 'a', "Item A"))
+
+        for x in (
+            copy.copy(FooEnum),
+            copy.deepcopy(FooEnum),
+            pickle.loads(pickle.dumps(FooEnum)),
+        ):
+            self.assertEqual(x.name, 'FooEnum')
+            self.assertEqual(list(x), [FooEnum.A])
+            self.assertEqual(list.__len__(x), 1)
+            self.assertEqual(x.A, FooEnum.A)
+
+    def test_missing_attribute(self):
+        FooEnum = Enum('FooEnum', Item(10, 'a', "Item A"))
+
+        with self.assertRaises(AttributeError):
+            FooEnum.B
+
     def test_simple_registry_enum(self):
         FooEnum = Enum('FooEnum')
 
@@ -205,6 +379,106 @@ class EnumConstructionTests(unittest.TestCase):
         self.assertEqual(FooEnum.A.display_extended(), "Item A (10)")
 
 
+class LazyEnumTests(unittest.TestCase):
+    def setUp(self):
+        super(LazyEnumTests, self).setUp()
+
+        self.calls = 0
+
+        def loader():
+            self.calls += 1
+
+            return [
+                Item(x, 'item_%d' % x, "Item %d" % x)
+                for x in range(1000)
+            ]
+
+        self.enum = LazyEnum('FooEnum', loader)
+
+    def assertLoaded(self):
+        self.assertTrue(self.enum.loaded)
+        self.assertEqual(self.calls, 1)
+
+    def test_not_loaded(self):
+        EnumField(self.enum)
+
+        self.assertFalse(self.enum.loaded)
+        self.assertEqual(self.calls, 0)
+        self.assertEqual(repr(self.enum), "<FooEnum: (not loaded)>")
+
+    @isolate_apps('tests')
+    def test_check_not_loaded(self):
+        class LazyModel(models.Model):
+            test_field = EnumField(self.enum)
+
+        self.assertEqual(LazyModel.check(), [])
+        self.assertFalse(self.enum.loaded)
+
+    def test_lookup(self):
+        self.assertEqual(self.enum.from_value(10).slug, 'item_10')
+        self.assertEqual(self.enum.from_slug('item_20').value, 20)
+        self.assertEqual(self.enum.to_python('30').value, 30)
+        self.assertLoaded()
+
+    def test_attribute(self):
+        self.assertEqual(self.enum.ITEM_999.value, 999)
+        self.assertLoaded()
+
+    def test_iteration(self):
+        self.assertEqual(len(list(self.enum)), 1000)
+        self.assertEqual(len(self.enum), 1000)
+        self.assertEqual(self.enum[-1].value, 999)
+        self.assertEqual(list.__len__(self.enum), 1000)
+        self.assertLoaded()
+
+    def test_get_choices(self):
+        self.assertEqual(self.enum.get_choices()[0], (self.enum[0], "Item 0"))
+        self.assertLoaded()
+
+    def test_add_item(self):
+        self.enum.add_item(Item(1000, 'item_1000', "Item 1000"))
+
+        self.assertEqual(len(self.enum), 1001)
+        self.assertLoaded()
+
+    def test_field(self):
+        field = EnumField(self.enum)
+
+        self.assertEqual(field.clean('item_5', None).value, 5)
+        self.assertEqual(len(field.formfield().choices), 1001)
+        self.assertLoaded()
+
+    def test_duplicates(self):
+        enum = LazyEnum('FooEnum', lambda: [
+            Item(10, 'a', "Item A"),
+            Item(10, 'b', "Item B"),
+        ])
+
+        for fn in (
+            lambda: enum.from_value(10),
+            lambda: enum.to_python(10),
+            lambda: enum.to_python('a'),
+        ):
+            with self.assertRaises(EnumLoadError) as cm:
+                fn()
+
+            self.assertNotIsInstance(cm.exception, ValueError)
+            self.assertIsInstance(cm.exception.__cause__, ValueError)
+
+        self.assertFalse(enum.loaded)
+
+    def test_set_field(self):
+        field = EnumSetField(self.enum)
+
+        self.assertFalse(self.enum.loaded)
+
+        self.assertEqual(field.get_prep_value([self.enum.ITEM_1]), 2)
+        self.assertLoaded()
+
+        with self.assertRaises(ValueError):
+            field.get_prep_value([self.enum.ITEM_63])
+
+
 class EnumTests(unittest.TestCase):
     def setUp(self):
         super(EnumTests, self).setUp()
@@ -307,6 +581,134 @@ class EnumTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.enum.to_python('not_a_slug')
 
+    def test_contains(self):
+        self.assertIn(self.enum.A, self.enum)
+        self.assertIn(Item(20, 'other', "Other"), self.enum)
+        self.assertIn(10, self.enum)
+        self.assertIn('10', self.enum)
+        self.assertIn('b', self.enum)
+
+        self.assertNotIn(999, self.enum)
+        self.assertNotIn('B', self.enum)
+        self.assertNotIn('not_a_slug', self.enum)
+        self.assertNotIn(None, self.enum)
+
+    def test_get_item(self):
+        self.assertIs(self.enum.get_item(Item(10, 'other', "Other")), self.enum.A)
+        self.assertIs(self.enum.get_item('b'), self.enum.B)
+
+        with self.assertRaises(ValueError):
+            self.enum.get_item(None)
+
+        with self.assertRaises(ValueError):
+            self.enum.get_item(Item(999, 'other', "Other"))
+
+    def test_transitions(self):
+        self.enum.transitions({self.enum.A: [self.enum.B], 'b': ['a', 'b']})
+
+        self.assertEqual(
+            self.enum.get_transition_sources(self.enum.B),
+            {self.enum.A, self.enum.B},
+        )
+        self.assertEqual(self.enum.get_transition_sources('a'), {self.enum.B})
+        self.assertTrue(self.enum.can_transition(self.enum.A, self.enum.B))
+        self.assertFalse(self.enum.can_transition(self.enum.A, self.enum.A))
+
+    def test_transitions_not_declared(self):
+        with self.assertRaises(ValueError):
+            self.enum.get_transition_sources(self.enum.A)
+
+    def test_transitions_invalid_item(self):
+        with self.assertRaises(ValueError):
+            self.enum.transitions({self.enum.A: [999]})
+
+    def test_partition(self):
+        objs = [
+            {'status': self.large_enum.ITEM_C},
+            {'status': 10},
+            {'status': 'item_c'},
+            {'status': '30'},
+        ]
+
+        result = self.large_enum.partition(objs, lambda x: x['status'])
+
+        self.assertEqual(list(result), list(self.large_enum))
+        self.assertEqual(
+            [len(x) for x in result.values()],
+            [1, 0, 3, 0, 0],
+        )
+        self.assertEqual(
+            result[self.large_enum.ITEM_C],
+            [objs[0], objs[2], objs[3]],
+        )
+
+    def test_partition_invalid(self):
+        with self.assertRaises(ValueError):
+            self.enum.partition([999], lambda x: x)
+
+        with self.assertRaises(ValueError):
+            self.enum.partition([None], lambda x: x)
+
+    def test_count_by(self):
+        objs = [self.large_enum.ITEM_E, 'item_e', 10, self.large_enum.ITEM_A]
+
+        self.assertEqual(
+            list(self.large_enum.count_by(objs, lambda x: x).items()),
+            [
+                (self.large_enum.ITEM_A, 2),
+                (self.large_enum.ITEM_B, 0),
+                (self.large_enum.ITEM_C, 0),
+                (self.large_enum.ITEM_D, 0),
+                (self.large_enum.ITEM_E, 2),
+            ],
+        )
+
+    def test_count_by_invalid(self):
+        with self.assertRaises(ValueError):
+            self.enum.count_by(['nope'], lambda x: x)
+
+    def test_group(self):
+        group = self.large_enum.group('FIRST', 'item_b', self.large_enum.ITEM_A)
+
+        self.assertIs(self.large_enum.FIRST, group)
+        self.assertEqual(group.name, 'FIRST')
+        self.assertEqual(group.values, (20, 10))
+        self.assertEqual(
+            group,
+            {self.large_enum.ITEM_A, self.large_enum.ITEM_B},
+        )
+        self.assertIn(self.large_enum.ITEM_A, group)
+        self.assertIn(20, group)
+        self.assertNotIn(self.large_enum.ITEM_C, group)
+        self.assertEqual(self.large_enum.get_groups(), [group])
+        self.assertEqual(
+            repr(group),
+            "<FIRST: [%r, %r]>" % (self.large_enum.ITEM_B, self.large_enum.ITEM_A),
+        )
+
+    def test_group_invalid(self):
+        with self.assertRaises(ValueError):
+            self.enum.group('GROUP', 999)
+
+        self.enum.group('GROUP', self.enum.A)
+
+        with self.assertRaises(ValueError):
+            self.enum.group('GROUP', self.enum.B)
+
+        with self.assertRaises(ValueError):
+            self.enum.group('A', self.enum.B)
+
+        with self.assertRaises(ValueError):
+            self.enum.add_item(Item(30, 'group', "Group"))
+
+    def test_group_invalid_name(self):
+        for name in ('name', 'frozen', 'loaded', 'get_choices', 'group'):
+            with self.assertRaises(ValueError):
+                self.enum.group(name, self.enum.A)
+
+        self.assertEqual(self.enum.name, 'FooEnum')
+        self.assertEqual(self.enum.get_groups(), [])
+
     def test_repr(self):
         self.assertEqual(
             repr(self.enum),
@@ -400,6 +802,35 @@ class FieldTests(DjangoTestCase):
             [m1],
         )
 
+    def test_get_prep_value(self):
+        field = TestModel._meta.get_field('test_field')
+
+        self.assertEqual(field.get_prep_value(TestModelEnum.A), 10)
+        self.assertEqual(field.get_prep_value(20), 20)
+        self.assertEqual(field.get_prep_value('20'), 20)
+        self.assertEqual(field.get_prep_value('b'), 20)
+        self.assertEqual(field.get_prep_value(None), None)
+
+        with self.assertRaises(ValueError):
+            field.get_prep_value(999)
+
+    def test_bulk_create(self):
+        TestModel.objects.bulk_create([
+            TestModel(test_field=TestModelEnum.B, test_field_no_default=10),
+            TestModel(test_field='a', test_field_no_default=TestModelEnum.B),
+        ])
+
+        self.assertEqual(
+            list(TestModel.objects.order_by('pk').values_list(
+                'test_field',
+                'test_field_no_default',
+            )),
+            [
+                (TestModelEnum.B, TestModelEnum.A),
+                (TestModelEnum.A, TestModelEnum.B),
+            ],
+        )
+
     def test_null_field(self):
         TestModelNull.objects.create(test_field_null=None)
 
@@ -446,6 +877,590 @@ class FieldTests(DjangoTestCase):
         self.assertEqual(list(query), [m1])
 
 
+class BulkUpdateEnumTests(DjangoTestCase):
+    def setUp(self):
+        super(BulkUpdateEnumTests, self).setUp()
+
+        self.objs = [
+            TestModel.objects.create(test_field_no_default=TestModelEnum.A)
+            for _ in range(5)
+        ]
+
+    def test_bulk_update_enum(self):
+        for idx, obj in enumerate(self.objs):
+            obj.test_field = TestModelEnum.B
+            obj.test_field_no_default = (TestModelEnum.A, 'b', 20)[idx % 3]
+
+        with self.assertNumQueries(2):
+            rows = TestModel.objects.bulk_update_enum(
+                self.objs,
+                ['test_field', 'test_field_no_default'],
+            )
+
+        self.assertEqual(rows, 5)
+        self.assertEqual(
+            [
+                (x.test_field, x.test_field_no_default)
+                for x in TestModel.objects.order_by('pk')
+            ],
+            [
+                (TestModelEnum.B, TestModelEnum.A),
+                (TestModelEnum.B, TestModelEnum.B),
+                (TestModelEnum.B, TestModelEnum.B),
+                (TestModelEnum.B, TestModelEnum.A),
+                (TestModelEnum.B, TestModelEnum.B),
+            ],
+        )
+
+    def test_bulk_update_enum_batch_size(self):
+        for obj in self.objs:
+            obj.test_field_no_default = TestModelEnum.B
+
+        with self.assertNumQueries(3):
+            rows = TestModel.objects.bulk_update_enum(
+                self.objs,
+                ['test_field_no_default'],
+                batch_size=2,
+            )
+
+        self.assertEqual(rows, 5)
+        self.assertEqual(
+            TestModel.objects.filter(test_field_no_default=TestModelEnum.B).count(),
+            5,
+        )
+
+    def test_bulk_update_enum_invalid_batch_size(self):
+        for batch_size in (0, -1):
+            with self.assertRaises(ValueError):
+                TestModel.objects.bulk_update_enum(
+                    self.objs,
+                    ['test_field_no_default'],
+                    batch_size=batch_size,
+                )
+
+    def test_bulk_update_enum_non_enum_field(self):
+        with self.assertRaises(ValueError):
+            TestModel.objects.bulk_update_enum(self.objs, ['id'])
+
+    def test_bulk_update_enum_requires_pk(self):
+        with self.assertRaises(ValueError):
+            TestModel.objects.bulk_update_enum(
+                [TestModel(test_field_no_default=TestModelEnum.B)],
+                ['test_field_no_default'],
+            )
+
+
+class TransitionTests(DjangoTestCase):
+    def setUp(self):
+        super(TransitionTests, self).setUp()
+
+        for x in (StatusEnum.PENDING, StatusEnum.RUNNING, StatusEnum.DONE):
+            TestModelStatus.objects.create(status=x)
+
+    def assertStatuses(self, *statuses):
+        self.assertEqual(
+            list(TestModelStatus.objects.order_by('pk').values_list(
+                'status',
+                flat=True,
+            )),
+            list(statuses),
+        )
+
+    def test_transition(self):
+        with self.assertNumQueries(1):
+            rows = TestModelStatus.objects.transition('status', StatusEnum.FAILED)
+
+        self.assertEqual(rows, 1)
+        self.assertStatuses(
+            StatusEnum.PENDING,
+            StatusEnum.FAILED,
+            StatusEnum.DONE,
+        )
+
+    def test_transition_filtered(self):
+        qs = TestModelStatus.objects.filter(status=StatusEnum.DONE)
+
+        self.assertEqual(qs.transition('status', 'running'), 0)
+        self.assertStatuses(
+            StatusEnum.PENDING,
+            StatusEnum.RUNNING,
+            StatusEnum.DONE,
+        )
+
+    def test_transition_non_enum_field(self):
+        with self.assertRaises(ValueError):
+            TestModelStatus.objects.transition('id', StatusEnum.DONE)
+
+    def test_transition_invalid_target(self):
+        with self.assertRaises(ValueError):
+            TestModelStatus.objects.transition('status', 999)
+
+
+class GroupTests(DjangoTestCase):
+    def setUp(self):
+        super(GroupTests, self).setUp()
+
+        for x in (StatusEnum.PENDING, StatusEnum.RUNNING, StatusEnum.DONE):
+            TestModelStatus.objects.create(status=x)
+
+    def test_group_q(self):
+        self.assertEqual(
+            list(TestModelStatus.objects.filter(
+                StatusEnum.OPEN.q('status'),
+            ).order_by('pk').values_list('status', flat=True)),
+            [StatusEnum.PENDING, StatusEnum.RUNNING],
+        )
+        self.assertEqual(
+            TestModelStatus.objects.filter(status__in=StatusEnum.OPEN).count(),
+            2,
+        )
+
+
+class EnumSetFieldTests(DjangoTestCase):
+    def test_default(self):
+        model = TestModelSet.objects.create()
+        model.refresh_from_db()
+
+        self.assertEqual(model.test_field, frozenset())
+        self.assertIsNone(model.test_field_null)
+
+    def test_round_trip(self):
+        model = TestModelSet.objects.create(
+            test_field={TestModelEnum.A, 'b'},
+            test_field_null=[10],
+        )
+        model.refresh_from_db()
+
+        self.assertEqual(model.test_field, {TestModelEnum.A, TestModelEnum.B})
+        self.assertIsInstance(model.test_field, frozenset)
+        self.assertEqual(model.test_field_null, {TestModelEnum.A})
+
+        for x in model.test_field:
+            self.assertIs(x, TestModelEnum.from_value(x.value))
+
+    def test_stored_as_bitmask(self):
+        TestModelSet.objects.create(test_field=[TestModelEnum.A, TestModelEnum.B])
+
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT test_field FROM tests_testmodelset')
+            self.assertEqual(cursor.fetchone(), ((1 << 10) | (1 << 20),))
+
+    def test_lookups(self):
+        m1 = TestModelSet.objects.create(test_field=[TestModelEnum.A])
+        m2 = TestModelSet.objects.create(test_field=[TestModelEnum.B])
+        m3 = TestModelSet.objects.create(
+            test_field=[TestModelEnum.A, TestModelEnum.B],
+        )
+        TestModelSet.objects.create()
+
+        def assertLookup(expected, **kwargs):
+            self.assertEqual(
+                list(TestModelSet.objects.filter(**kwargs).order_by('pk')),
+                expected,
+            )
+
+        assertLookup([m1, m3], test_field__has=TestModelEnum.A)
+        assertLookup([m2, m3], test_field__has='b')
+        assertLookup([m3], test_field__has_all=[TestModelEnum.A, TestModelEnum.B])
+        assertLookup([m1, m2, m3], test_field__has_any=['a', 'b'])
+        assertLookup([m2], test_field={TestModelEnum.B})
+
+    def test_invalid_item_values(self):
+        with self.assertRaises(ValueError):
+            EnumSetField(Enum('FooEnum', Item(63, 'a', "Item A")))
+
+        with self.assertRaises(ValueError):
+            EnumSetField(Enum('FooEnum', Item(-1, 'a', "Item A")))
+
+    def test_invalid_bits(self):
+        field = TestModelSet._meta.get_field('test_field')
+
+        with self.assertRaises(ValueError):
+            field.to_python(1)
+
+    def test_deconstruct(self):
+        name, path, args, kwargs = TestModelSet._meta.get_field(
+            'test_field',
+        ).deconstruct()
+
+        self.assertEqual(path, 'django.db.models.BigIntegerField')
+        self.assertEqual(kwargs, {'default': 0})
+
+
+class ExpressionTests(DjangoTestCase):
+    def setUp(self):
+        super(ExpressionTests, self).setUp()
+
+        for x in StatusEnum:
+            TestModelStatus.objects.create(status=x)
+
+    def test_display_expression(self):
+        qs = TestModelStatus.objects.annotate(
+            display=StatusEnum.get_display_expression('status'),
+        ).order_by('display')
+
+        self.assertEqual(
+            [x.display for x in qs],
+            ["Done", "Failed", "Pending", "Running"],
+        )
+
+    def test_display_expression_uses_active_language(self):
+        FooEnum = Enum(
+            'FooEnum',
+            Item(1, 'item', lazy(translation.get_language, str)()),
+        )
+
+        with translation.override('de'):
+            expression = FooEnum.get_display_expression('status')
+
+        self.assertEqual(
+            list(TestModelStatus.objects.filter(status=1).annotate(
+                display=expression,
+            ).values_list('display', flat=True)),
+            ['de'],
+        )
+
+    def test_rank_expression(self):
+        qs = TestModelStatus.objects.order_by(
+            StatusEnum.get_rank_expression('status', [
+                StatusEnum.RUNNING,
+                'failed',
+                StatusEnum.PENDING,
+                StatusEnum.DONE,
+            ]),
+        )
+
+        self.assertEqual(
+            [x.status for x in qs],
+            [
+                StatusEnum.RUNNING,
+                StatusEnum.FAILED,
+                StatusEnum.PENDING,
+                StatusEnum.DONE,
+            ],
+        )
+
+    def test_rank_expression_default_ordering(self):
+        field = TestModelStatus._meta.get_field('status')
+        qs = TestModelStatus.objects.order_by(
+            field.get_rank_expression().desc(),
+        )
+
+        self.assertEqual([x.status for x in qs], list(reversed(StatusEnum)))
+
+    def test_field_display_expression(self):
+        field = TestModelStatus._meta.get_field('status')
+        qs = TestModelStatus.objects.annotate(
+            display=field.get_display_expression(),
+        ).filter(display="Running")
+
+        self.assertEqual([x.status for x in qs], [StatusEnum.RUNNING])
+
+
+class ValidationTests(DjangoTestCase):
+    def test_full_clean(self):
+        model = TestModel(test_field_no_default='b')
+        model.full_clean()
+
+        self.assertIs(model.test_field_no_default, TestModelEnum.B)
+
+    def test_full_clean_invalid_value(self):
+        model = TestModel(test_field_no_default=999)
+
+        with self.assertRaises(ValidationError) as cm:
+            model.full_clean()
+
+        self.assertIn('test_field_no_default', cm.exception.error_dict)
+
+    def test_full_clean_null(self):
+        with self.assertRaises(ValidationError) as cm:
+            TestModel(test_field_no_default=None).full_clean()
+
+        self.assertEqual(
+            cm.exception.error_dict['test_field_no_default'][0].code,
+            'null',
+        )
+
+    def test_custom_choices(self):
+        field = EnumField(TestModelEnum, choices=[(TestModelEnum.A, "A")])
+
+        field.clean(TestModelEnum.A, None)
+
+        with self.assertRaises(ValidationError):
+            field.clean(TestModelEnum.B, None)
+
+
+class TestModelForm(forms.ModelForm):
+    class Meta:
+        model = TestModel
+        fields = ('test_field', 'test_field_no_default')
+
+
+class FormTests(DjangoTestCase):
+    def test_form_field_class(self):
+        field = TestModelForm().fields['test_field_no_default']
+
+        self.assertIsInstance(field, EnumChoiceField)
+        self.assertTrue(field._enum_choices)
+
+    def test_valid(self):
+        form = TestModelForm({'test_field': 'a', 'test_field_no_default': '20'})
+
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertIs(form.cleaned_data['test_field'], TestModelEnum.A)
+        self.assertIs(form.cleaned_data['test_field_no_default'], TestModelEnum.B)
+
+        model = form.save()
+        self.assertEqual(model.test_field_no_default, TestModelEnum.B)
+
+    def test_invalid(self):
+        form = TestModelForm({'test_field': 'a', 'test_field_no_default': '999'})
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(
+            form.errors['test_field_no_default'][0].split()[0],
+            'Select',
+        )
+
+    def test_narrowed_choices(self):
+        form = TestModelForm({'test_field': 'a', 'test_field_no_default': 'b'})
+        form.fields['test_field_no_default'].choices = [
+            (TestModelEnum.A, "Item A"),
+        ]
+
+        self.assertFalse(form.is_valid())
+        self.assertIn('test_field_no_default', form.errors)
+
+        form = TestModelForm({'test_field': 'a', 'test_field_no_default': 'a'})
+        form.fields['test_field_no_default'].choices = [
+            (TestModelEnum.A, "Item A"),
+        ]
+
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertIs(form.cleaned_data['test_field_no_default'], TestModelEnum.A)
+
+        # Narrowing the choices of one form does not affect others
+        form = TestModelForm({'test_field': 'a', 'test_field_no_default': 'b'})
+
+        self.assertTrue(form.is_valid(), form.errors)
+
+    def test_required(self):
+        form = TestModelForm({'test_field': 'a', 'test_field_no_default': ''})
+
+        self.assertFalse(form.is_valid())
+        self.assertIn('test_field_no_default', form.errors)
+
+
+class EnumFieldListFilterTests(DjangoTestCase):
+    class User:
+        is_active = True
+        is_staff = True
+
+        def has_perm(self, perm, obj=None):
+            return True
+
+    def setUp(self):
+        super(EnumFieldListFilterTests, self).setUp()
+
+        for x in (StatusEnum.PENDING, StatusEnum.PENDING, StatusEnum.DONE):
+            TestModelStatus.objects.create(status=x)
+
+        for x in (TestModelEnum.A, None, None):
+            TestModelNull.objects.create(test_field_null=x)
+
+        cache.clear()
+
+    def get_changelist(self, model, list_filter, params):
+        request = RequestFactory().get('/', params)
+        request.user = self.User()
+
+        model_admin = ModelAdmin(model, AdminSite())
+        model_admin.list_filter = list_filter
+
+        return model_admin.get_changelist_instance(request)
+
+    def get_choices(self, model, field_path, params, filter_class=None):
+        changelist = self.get_changelist(
+            model,
+            [(field_path, filter_class or EnumFieldListFilter)],
+            params,
+        )
+
+        with self.assertNumQueries(1):
+            return list(changelist.filter_specs[0].choices(changelist))
+
+    def test_counts(self):
+        choices = self.get_choices(TestModelStatus, 'status', {})
+
+        self.assertEqual(
+            [(x['display'], x['selected'], x['query_string']) for x in choices],
+            [
+                ("All", True, '?'),
+                ("Pending (2)", False, '?status__exact=1'),
+                ("Running (0)", False, '?status__exact=2'),
+                ("Done (1)", False, '?status__exact=3'),
+                ("Failed (0)", False, '?status__exact=4'),
+            ],
+        )
+
+    def test_counts_while_selected(self):
+        choices = self.get_choices(
+            TestModelStatus,
+            'status',
+            {'status__exact': '3'},
+        )
+
+        self.assertEqual(
+            [(x['display'], x['selected']) for x in choices],
+            [
+                ("All", False),
+                ("Pending (2)", False),
+                ("Running (0)", False),
+                ("Done (1)", True),
+                ("Failed (0)", False),
+            ],
+        )
+
+    def test_counts_while_selected_with_other_filters(self):
+        for x, y in (
+            (TestModelEnum.A, TestModelEnum.A),
+            (TestModelEnum.B, TestModelEnum.A),
+            (TestModelEnum.B, TestModelEnum.B),
+            (TestModelEnum.A, TestModelEnum.B),
+            (TestModelEnum.A, TestModelEnum.B),
+        ):
+            TestModel.objects.create(test_field=x, test_field_no_default=y)
+
+        changelist = self.get_changelist(
+            TestModel,
+            [
+                ('test_field', EnumFieldListFilter),
+                ('test_field_no_default', EnumFieldListFilter),
+            ],
+            {'test_field__exact': '20', 'test_field_no_default__exact': '20'},
+        )
+
+        self.assertEqual(
+            [
+                [x['display'] for x in y.choices(changelist)]
+                for y in changelist.filter_specs
+            ],
+            [
+                ["All", "Item A (2)", "Item B (1)"],
+                ["All", "Item A (1)", "Item B (1)"],
+            ],
+        )
+
+    def test_null(self):
+        choices = self.get_choices(TestModelNull, 'test_field_null', {})
+
+        self.assertEqual(
+            [x['display'] for x in choices],
+            ["All", "Item A (1)", "Item B (0)", "None (2)"],
+        )
+
+    def test_cache(self):
+        class CachedEnumFieldListFilter(EnumFieldListFilter):
+            cache_timeout = 60
+
+        self.get_choices(
+            TestModelStatus,
+            'status',
+            {},
+            CachedEnumFieldListFilter,
+        )
+        TestModelStatus.objects.create(status=StatusEnum.RUNNING)
+
+        changelist = self.get_changelist(
+            TestModelStatus,
+            [('status', CachedEnumFieldListFilter)],
+            {},
+        )
+
+        with self.assertNumQueries(0):
+            choices = list(changelist.filter_specs[0].choices(changelist))
+
+        self.assertEqual(choices[2]['display'], "Running (0)")
+
+    def test_not_registered(self):
+        field = TestModelStatus._meta.get_field('status')
+        list_filter = EnumFieldListFilter.create(
+            field,
+            RequestFactory().get('/'),
+            {},
+            TestModelStatus,
+            ModelAdmin(TestModelStatus, AdminSite()),
+            'status',
+        )
+
+        self.assertNotIsInstance(list_filter, EnumFieldListFilter)
+
+
+class ReferenceTableTests(DjangoTestCase):
+    def test_synced_on_migrate(self):
+        self.assertEqual(
+            list(EnumItem.objects.filter(
+                enum='tests.TestModelEnum',
+            ).order_by('value').values_list('value', 'slug', 'display')),
+            [(10, 'a', "Item A"), (20, 'b', "Item B")],
+        )
+
+    def test_unbounded_slug_and_display(self):
+        item = EnumItem(
+            enum='tests.TestModelEnum',
+            value=30,
+            slug='c' * 300,
+            display="Item C" * 100,
+        )
+        item.full_clean()
+        item.save()
+
+        item.refresh_from_db()
+        self.assertEqual(item.display, "Item C" * 100)
+
+    def test_sync_only_writes_changes(self):
+        EnumItem.objects.filter(enum='tests.StatusEnum', value=1).update(
+            display="Old",
+        )
+        EnumItem.objects.filter(enum='tests.StatusEnum', value=2).delete()
+        EnumItem.objects.create(
+            enum='tests.StatusEnum',
+            value=99,
+            slug='stale',
+            display="Stale",
+        )
+
+        # SELECT, INSERT, UPDATE and DELETE
+        with self.assertNumQueries(4):
+            sync_reference_table()
+
+        self.assertEqual(
+            list(EnumItem.objects.filter(
+                enum='tests.StatusEnum',
+            ).order_by('value').values_list('value', 'display')),
+            [(1, "Pending"), (2, "Running"), (3, "Done"), (4, "Failed")],
+        )
+
+        with self.assertNumQueries(1):
+            sync_reference_table()
+
+    def test_reference_subquery(self):
+        TestModelStatus.objects.create(status=StatusEnum.RUNNING)
+
+        self.assertEqual(
+            list(TestModelStatus.objects.annotate(
+                status_display=reference_subquery(StatusEnum, 'status'),
+            ).values_list('status_display', flat=True)),
+            ["Running"],
+        )
+
+    def test_get_enum_key(self):
+        self.assertEqual(get_enum_key(StatusEnum), 'tests.StatusEnum')
+
+        with self.assertRaises(ValueError):
+            get_enum_key(Enum('FooEnum'))
+
+
 class TemplateTests(DjangoTestCase):
     def test_renders_template(self):
         self.assertEqual(
@@ -458,6 +1473,212 @@ class TemplateTests(DjangoTestCase):
             render_to_string('invalid.html', {}, request=HttpRequest())
 
 
+class EnumsJSONTests(DjangoTestCase):
+    def test_enums_json(self):
+        response = self.client.get('/enums.json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(
+            json.loads(response.content)['tests']['TestModelEnum'],
+            [
+                {'value': 10, 'slug': 'a', 'display': "Item A"},
+                {'value': 20, 'slug': 'b', 'display': "Item B"},
+            ],
+        )
+
+    def test_not_modified(self):
+        etag = self.client.get('/enums.json')['ETag']
+
+        response = self.client.get('/enums.json', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_vary(self):
+        response = self.client.get('/enums.json')
+
+        self.assertEqual(response['Vary'], 'Accept-Language, Cookie')
+
+        response = self.client.get(
+            '/enums.json',
+            HTTP_IF_NONE_MATCH=response['ETag'],
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['Vary'], 'Accept-Language, Cookie')
+
+    def test_add_item_invalidates(self):
+        etag = self.client.get('/enums.json')['ETag']
+
+        ExtensibleEnum.add_item(Item(2, 'added', "Added"))
+
+        response = self.client.get('/enums.json', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(
+            json.loads(response.content)['tests']['ExtensibleEnum'][-1],
+            {'value': 2, 'slug': 'added', 'display': "Added"},
+        )
+
+    def test_method_not_allowed(self):
+        self.assertEqual(self.client.post('/enums.json').status_code, 405)
+
+    def test_other_enums_do_not_invalidate(self):
+        etag = self.client.get('/enums.json')['ETag']
+
+        Enum('Throwaway')
+        Enum('Throwaway', Item(1, 'a', "Item A")).add_item(Item(2, 'b', "Item B"))
+
+        with mock.patch(
+            'django_enumfield.views.json.dumps',
+            side_effect=AssertionError,
+        ):
+            response = self.client.get('/enums.json', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_export_enums(self):
+        stdout = io.StringIO()
+        call_command('export_enums', stdout=stdout)
+
+        self.assertEqual(
+            json.loads(stdout.getvalue()),
+            json.loads(self.client.get('/enums.json').content),
+        )
+
+
+class PreloadTests(unittest.TestCase):
+    def use_enums(self):
+        for app_enums in get_enums().values():
+            for enum in app_enums.values():
+                for x in enum:
+                    enum.from_value(x.value)
+                    enum.from_slug(x.slug)
+                    str(x.display)
+                    item_to_json(x, 'object')
+                enum.get_choices()
+
+        get_enums_json(settings.LANGUAGE_CODE)
+
+    def test_preload(self):
+        preload()
+
+        self.assertTrue(LargeEnum.loaded)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "Requires os.fork")
+    def test_worker_memory_growth(self):
+        """
+        Memory allocated by a forked worker when it first uses the enums after
+        they have been preloaded in the parent.
+        """
+
+        preload()
+
+        r, w = os.pipe()
+        pid = os.fork()
+
+        if pid == 0:
+            try:
+                os.close(r)
+                tracemalloc.start()
+                self.use_enums()
+                size, _ = tracemalloc.get_traced_memory()
+                os.write(w, str(size).encode('ascii'))
+            finally:
+                os._exit(0)
+
+        os.close(w)
+        with os.fdopen(r) as f:
+            size = int(f.read())
+        os.waitpid(pid, 0)
+
+        self.assertLess(size, 16 * 1024)
+
+
+class EncoderTests(unittest.TestCase):
+    def test_encoder(self):
+        self.assertEqual(
+            json.dumps({'status': StatusEnum.DONE}, cls=EnumJSONEncoder),
+            '{"status": 3}',
+        )
+
+    def test_representations(self):
+        data = [StatusEnum.DONE, None]
+
+        self.assertEqual(
+            json.loads(json.dumps(data, cls=get_encoder('slug'))),
+            ['done', None],
+        )
+        self.assertEqual(
+            json.loads(json.dumps(data, cls=get_encoder('object'))),
+            [{'value': 3, 'slug': 'done', 'display': "Done"}, None],
+        )
+
+    def test_invalid_representation(self):
+        with self.assertRaises(ValueError):
+            get_encoder('nope')
+
+    def test_object_cached_per_language(self):
+        item = Item(1, 'item', lazy(translation.get_language, str)())
+        encoder = get_encoder('object')
+
+        with translation.override('de'):
+            self.assertEqual(
+                json.loads(json.dumps(item, cls=encoder))['display'],
+                'de',
+            )
+
+        with translation.override('fr'):
+            self.assertEqual(
+                json.loads(json.dumps([item, item], cls=encoder)),
+                [{'value': 1, 'slug': 'item', 'display': 'fr'}] * 2,
+            )
+
+    def test_object_copied(self):
+        item = Item(1, 'item', "Item")
+
+        item_to_json(item, 'object')['display'] = "Changed"
+
+        self.assertEqual(
+            item_to_json(item, 'object'),
+            {'value': 1, 'slug': 'item', 'display': "Item"},
+        )
+
+    def test_object_cache_freed_with_item(self):
+        item = Item(1, 'item', "Item")
+        item_to_json(item, 'object')
+
+        ref = weakref.ref(item)
+        del item
+
+        self.assertIsNone(ref())
+
+    def test_object_cache_distinguishes_items_with_equal_values(self):
+        self.assertEqual(
+            [
+                item_to_json(Item(1, x, x.capitalize()), 'object')['slug']
+                for x in ('a', 'b')
+            ],
+            ['a', 'b'],
+        )
+
+    def test_response(self):
+        response = EnumJsonResponse(
+            {'status': StatusEnum.RUNNING},
+            representation='slug',
+        )
+
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(response.content), {'status': 'running'})
+
+    def test_response_default_representation(self):
+        response = EnumJsonResponse({'status': StatusEnum.RUNNING})
+
+        self.assertEqual(json.loads(response.content), {'status': 2})
+
+
 class UtilsTests(unittest.TestCase):
     def test_get_enum_or_404_valid(self):
         self.assertEqual(
@@ -518,6 +1739,188 @@ class MigrationUnitTests(DjangoTestCase):
         self.assertEqual(clone.default, 10)
 
 
+class RemapEnumValuesTests(TransactionTestCase):
+    def setUp(self):
+        super(RemapEnumValuesTests, self).setUp()
+
+        for x in (
+            StatusEnum.PENDING,
+            StatusEnum.DONE,
+            StatusEnum.RUNNING,
+            StatusEnum.PENDING,
+            StatusEnum.DONE,
+        ):
+            TestModelStatus.objects.create(status=x)
+
+        self.state = ProjectState.from_apps(apps)
+
+    def assertStatuses(self, *statuses):
+        self.assertEqual(
+            list(TestModelStatus.objects.order_by('pk').values_list(
+                'status',
+                flat=True,
+            )),
+            [StatusEnum.from_slug(x) for x in statuses],
+        )
+
+    def run_operation(self, operation, backwards=False):
+        with connection.schema_editor() as editor:
+            if backwards:
+                operation.database_backwards(
+                    'tests', editor, self.state, self.state,
+                )
+            else:
+                operation.database_forwards(
+                    'tests', editor, self.state, self.state,
+                )
+
+    def test_remap(self):
+        progress = []
+        operation = RemapEnumValues(
+            'TestModelStatus',
+            'status',
+            {1: 3, 3: 1},
+            batch_size=2,
+            progress=progress.append,
+        )
+
+        self.run_operation(operation)
+
+        self.assertStatuses('done', 'pending', 'running', 'done', 'pending')
+        self.assertEqual(progress, [2, 3, 4])
+
+        self.assertTrue(operation.reversible)
+        self.run_operation(operation, backwards=True)
+
+        self.assertStatuses('pending', 'done', 'running', 'pending', 'done')
+
+    def test_remap_merge_is_irreversible(self):
+        operation = RemapEnumValues('TestModelStatus', 'status', {1: 3, 2: 3})
+
+        self.run_operation(operation)
+
+        self.assertStatuses('done', 'done', 'done', 'done', 'done')
+        self.assertFalse(operation.reversible)
+
+    def test_remap_onto_existing_value_is_irreversible(self):
+        operation = RemapEnumValues('TestModelStatus', 'status', {1: 3})
+
+        self.run_operation(operation)
+
+        self.assertStatuses('done', 'done', 'running', 'done', 'done')
+        self.assertFalse(operation.reversible)
+
+    def test_remap_non_atomic_commits_batches(self):
+        def progress(rows):
+            raise RuntimeError()
+
+        operation = RemapEnumValues(
+            'TestModelStatus',
+            'status',
+            {1: 3, 3: 1},
+            batch_size=2,
+            progress=progress,
+        )
+
+        with self.assertRaises(RuntimeError):
+            with connection.schema_editor(atomic=False) as editor:
+                operation.database_forwards(
+                    'tests', editor, self.state, self.state,
+                )
+
+        self.assertStatuses('done', 'pending', 'running', 'pending', 'done')
+
+    def test_remap_atomic_rolls_back_batches(self):
+        def progress(rows):
+            raise RuntimeError()
+
+        operation = RemapEnumValues(
+            'TestModelStatus',
+            'status',
+            {1: 3, 3: 1},
+            batch_size=2,
+            progress=progress,
+        )
+
+        with self.assertRaises(RuntimeError):
+            self.run_operation(operation)
+
+        self.assertStatuses('pending', 'done', 'running', 'pending', 'done')
+
+    def test_deconstruct(self):
+        operation = RemapEnumValues('TestModelStatus', 'status', {1: 3})
+
+        self.assertEqual(
+            operation.deconstruct(),
+            ('RemapEnumValues', [], {
+                'model_name': 'TestModelStatus',
+                'name': 'status',
+                'mapping': {1: 3},
+                'batch_size': 10000,
+            }),
+        )
+
+
+class AuditEnumValuesTests(DjangoTestCase):
+    def setUp(self):
+        super(AuditEnumValuesTests, self).setUp()
+
+        for x in StatusEnum:
+            TestModelStatus.objects.create(status=x)
+
+    def call_command(self, *args, **kwargs):
+        stdout = io.StringIO()
+        call_command('audit_enum_values', *args, stdout=stdout, **kwargs)
+        return stdout.getvalue()
+
+    def test_valid(self):
+        self.assertEqual(self.call_command('tests'), '')
+
+        self.assertIn(
+            'tests.TestModelStatus.status: OK',
+            self.call_command('tests', verbosity=2),
+        )
+
+    def test_bounds_from_whole_table(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.call_command('tests', batch_size=2)
+
+        bounds = [x['sql'] for x in ctx.captured_queries if 'MIN(' in x['sql']]
+
+        self.assertTrue(bounds)
+        for sql in bounds:
+            self.assertNotIn('WHERE', sql)
+
+    def test_invalid(self):
+        with connection.cursor() as cursor:
+            cursor.execute('UPDATE tests_testmodelstatus SET status = 99')
+            cursor.execute(
+                'UPDATE tests_testmodelstatus SET status = 98 WHERE id = %s',
+                [TestModelStatus.objects.order_by('pk').values_list(
+                    'pk',
+                    flat=True,
+                )[0]],
+            )
+
+        stdout = io.StringIO()
+        with self.assertRaises(CommandError) as cm:
+            call_command(
+                'audit_enum_values',
+                'tests',
+                batch_size=2,
+                stdout=stdout,
+            )
+
+        self.assertEqual(
+            stdout.getvalue(),
+            'tests.TestModelStatus.status: 98 (1 rows), 99 (3 rows)\n',
+        )
+        self.assertEqual(
+            str(cm.exception),
+            'Found 4 rows with invalid enum values',
+        )
+
+
 class SerialisationTests(DjangoTestCase):
     def test_serialisation(self):
         m_in = TestModel.objects.create(test_field_no_default=TestModelEnum.B)
@@ -533,3 +1936,88 @@ class SerialisationTests(DjangoTestCase):
             m_in.test_field_no_default,
             m_out.test_field_no_default,
         )
+
+    def test_serialisation_json(self):
+        TestModel.objects.create(test_field_no_default=TestModelEnum.B)
+
+        data = serializers.serialize('json', TestModel.objects.all())
+
+        self.assertEqual(
+            json.loads(data)[0]['fields'],
+            {'test_field': '10', 'test_field_no_default': '20'},
+        )
+
+        m_out = next(serializers.deserialize('json', data)).object
+
+        self.assertIs(m_out.test_field, TestModelEnum.A)
+        self.assertIs(m_out.test_field_no_default, TestModelEnum.B)
+
+    def test_serialisation_null(self):
+        TestModelNull.objects.create(test_field_null=None)
+
+        data = serializers.serialize('json', TestModelNull.objects.all())
+
+        self.assertEqual(
+            json.loads(data)[0]['fields'],
+            {'test_field_null': None},
+        )
+
+        m_out = next(serializers.deserialize('json', data)).object
+
+        self.assertIsNone(m_out.test_field_null)
+
+    def test_serialisation_slugs(self):
+        TestModelSlug.objects.create(status=StatusEnum.DONE)
+        TestModelSlug.objects.create(status=None)
+
+        data = serializers.serialize('json', TestModelSlug.objects.order_by('pk'))
+
+        self.assertEqual(
+            [x['fields'] for x in json.loads(data)],
+            [{'status': 'done'}, {'status': None}],
+        )
+
+        self.assertEqual(
+            [x.object.status for x in serializers.deserialize('json', data)],
+            [StatusEnum.DONE, None],
+        )
+
+    def test_serialisation_slugs_fixture(self):
+        TestModelSlug.objects.create(status=StatusEnum.RUNNING)
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            fixture = os.path.join(tempdir, 'slugs.json')
+            call_command('dumpdata', 'tests.TestModelSlug', output=fixture)
+
+            with open(fixture) as f:
+                self.assertEqual(json.load(f)[0]['fields'], {'status': 'running'})
+
+            TestModelSlug.objects.all().delete()
+            call_command('loaddata', fixture, verbosity=0)
+
+        self.assertEqual(
+            list(TestModelSlug.objects.values_list('status', flat=True)),
+            [StatusEnum.RUNNING],
+        )
+
+    def test_serialisation_does_not_parse_items(self):
+        TestModel.objects.bulk_create([
+            TestModel(test_field_no_default=TestModelEnum.B)
+            for _ in range(1000)
+        ])
+        objs = list(TestModel.objects.all())
+
+        with mock.patch.object(
+            TestModelEnum,
+            'to_python',
+            side_effect=AssertionError,
+        ):
+            data = serializers.serialize('json', objs)
+
+        self.assertEqual(
+            [x.object.test_field_no_default for x in serializers.deserialize(
+                'json',
+                data,
+            )],
+            [TestModelEnum.B] * 1000,
+        )
@@ -1 +1,7 @@
-urlpatterns = []
+from django.urls import path
+
+from django_enumfield.views import enums_json
+
+urlpatterns = [
+    path('enums.json', enums_json),
+]